@@ -67,8 +67,11 @@ dpath = fetch_rgc_spike_trains()
 with open(op.join(dpath, 'data_RGCs.json'), 'r') as f:
     rgcs_dataset = json.loads(f.read())
 
-stim = np.array(rgcs_dataset['stim'])
-stim_times = np.array(rgcs_dataset['stim_times'])
+# the stimulation is a long list of floats, so give ``numpy`` its dtype
+# and length up front. Only the first two stimulation times are needed.
+stim = np.fromiter(rgcs_dataset['stim'], dtype=float,
+                   count=len(rgcs_dataset['stim']))
+stim_times = rgcs_dataset['stim_times']
 
 n_cells = len(rgcs_dataset['spike_times'])
 dt = stim_times[1] - stim_times[0]  # time between the stimulation
@@ -134,7 +137,8 @@ plt.show()
 # history into our design matrix.
 
 n_t_filt = 25  # tweak this to see different results
-stim_padded = np.pad(stim, (n_t_filt - 1, 0))
+stim_padded = np.zeros(n_times + n_t_filt - 1)
+stim_padded[n_t_filt - 1:] = stim
 Xdsgn = hankel(stim_padded[0: -n_t_filt + 1], stim[-n_t_filt:])
 
 plt.figure()
@@ -194,10 +198,11 @@ n_t_filt = 25  # same as before, stimulation history
 n_t_hist = 20  # spikes history
 
 # using both stimulation history and spikes history
-y_padded = np.pad(y, (n_t_hist, 0))
+y_padded = np.zeros(n_times + n_t_hist, dtype=y.dtype)
+y_padded[n_t_hist:] = y
 
 Xstim = hankel(stim_padded[:-n_t_filt + 1], stim[-n_t_filt:])
-Xspikes = hankel(y_padded[:-n_t_hist], stim[-n_t_hist:])
+Xspikes = hankel(y_padded[:-n_t_hist], y_padded[-n_t_hist - 1:-1])
 Xdsgn_hist = np.hstack((Xstim, Xspikes))  # design matrix with spikes history
 
 ########################################################
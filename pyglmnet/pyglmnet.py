@@ -97,8 +97,9 @@ def _mu(distr, z, eta, fit_intercept):
     elif distr == 'poisson':
         mu = z.copy()
         beta0 = (1 - eta) * np.exp(eta) if fit_intercept else 0.
-        mu[z > eta] = z[z > eta] * np.exp(eta) + beta0
-        mu[z <= eta] = np.exp(z[z <= eta])
+        linear = z > eta
+        mu[linear] = z[linear] * np.exp(eta) + beta0
+        mu[~linear] = np.exp(z[~linear])
     elif distr == 'gaussian':
         mu = z
     elif distr == 'binomial':
@@ -114,8 +115,9 @@ def _grad_mu(distr, z, eta):
         grad_mu = expit(z)
     elif distr == 'poisson':
         grad_mu = z.copy()
-        grad_mu[z > eta] = np.ones_like(z)[z > eta] * np.exp(eta)
-        grad_mu[z <= eta] = np.exp(z[z <= eta])
+        linear = z > eta
+        grad_mu[linear] = np.exp(eta)
+        grad_mu[~linear] = np.exp(z[~linear])
     elif distr == 'gaussian':
         grad_mu = np.ones_like(z)
     elif distr == 'binomial':
@@ -131,7 +133,8 @@ def _logL(distr, y, y_hat, z=None, theta=1.0):
         eps = np.spacing(1)
         logL = np.sum(y * np.log(y_hat + eps) - y_hat)
     elif distr == 'gaussian':
-        logL = -0.5 * np.sum((y - y_hat)**2)
+        residual = np.ravel(y - y_hat)
+        logL = -0.5 * np.dot(residual, residual)
     elif distr == 'binomial':
 
         # prevents underflow
@@ -237,28 +240,22 @@ def _grad_L2loss(distr, alpha, Tau, reg_lambda, X, y, eta, theta, beta,
     n_samples, n_features = X.shape
     n_samples = np.float(n_samples)
 
-    if Tau is None:
-        if fit_intercept:
-            Tau = np.eye(beta[1:].shape[0])
-        else:
-            Tau = np.eye(beta.shape[0])
-    InvCov = np.dot(Tau.T, Tau)
-
     z = _z(beta[0], beta[1:], X, fit_intercept)
     mu = _mu(distr, z, eta, fit_intercept)
     grad_mu = _grad_mu(distr, z, eta)
 
     grad_beta0 = 0.
     if distr in ['poisson', 'softplus']:
+        # a single pass over X instead of one per term
+        grad_logl = grad_mu - y * grad_mu / mu
         if fit_intercept:
-            grad_beta0 = np.sum(grad_mu) - np.sum(y * grad_mu / mu)
-        grad_beta = ((np.dot(grad_mu.T, X) -
-                      np.dot((y * grad_mu / mu).T, X)).T)
+            grad_beta0 = np.sum(grad_logl)
+        grad_beta = np.dot(grad_logl.T, X).T
 
     elif distr == 'gaussian':
         if fit_intercept:
             grad_beta0 = np.sum((mu - y) * grad_mu)
-        grad_beta = np.dot((mu - y).T, X * grad_mu[:, None]).T
+        grad_beta = np.dot(((mu - y) * grad_mu).T, X).T
 
     elif distr == 'binomial':
         if fit_intercept:
@@ -289,13 +286,22 @@ def _grad_L2loss(distr, alpha, Tau, reg_lambda, X, y, eta, theta, beta,
 
     grad_beta0 *= 1. / n_samples
     grad_beta *= 1. / n_samples
+
+    # gradient of the L2 penalty, Tau.T Tau beta, computed with two
+    # matrix-vector products rather than forming Tau.T Tau
+    beta_pen = beta[1:] if fit_intercept else beta
+    if Tau is None:
+        grad_pen = beta_pen
+    else:
+        grad_pen = np.dot(Tau.T, np.dot(Tau, beta_pen))
+
     if fit_intercept:
-        grad_beta += reg_lambda * (1 - alpha) * np.dot(InvCov, beta[1:])
+        grad_beta += reg_lambda * (1 - alpha) * grad_pen
         g = np.zeros((n_features + 1, ))
         g[0] = grad_beta0
         g[1:] = grad_beta
     else:
-        grad_beta += reg_lambda * (1 - alpha) * np.dot(InvCov, beta)
+        grad_beta += reg_lambda * (1 - alpha) * grad_pen
         g = grad_beta
 
     return g
@@ -336,16 +342,17 @@ def _gradhess_logloss_1d(distr, xk, y, z, eta, theta, fit_intercept=True):
 
     elif distr == 'poisson':
         mu = _mu(distr, z, eta, fit_intercept)
-        s = expit(z)
-        gk = np.sum((mu[z <= eta] - y[z <= eta]) *
-                    xk[z <= eta]) + \
+        linear = z > eta
+        exp_part = ~linear
+        gk = np.sum((mu[exp_part] - y[exp_part]) *
+                    xk[exp_part]) + \
             np.exp(eta) * \
-            np.sum((1 - y[z > eta] / mu[z > eta]) *
-                   xk[z > eta])
-        hk = np.sum(mu[z <= eta] * xk[z <= eta] ** 2) + \
+            np.sum((1 - y[linear] / mu[linear]) *
+                   xk[linear])
+        hk = np.sum(mu[exp_part] * xk[exp_part] ** 2) + \
             np.exp(eta) ** 2 * \
-            np.sum(y[z > eta] / (mu[z > eta] ** 2) *
-                   (xk[z > eta] ** 2))
+            np.sum(y[linear] / (mu[linear] ** 2) *
+                   (xk[linear] ** 2))
 
     elif distr == 'gaussian':
         gk = np.sum((z - y) * xk)
@@ -758,6 +765,9 @@ class GLM(BaseEstimator):
         n_samples, n_features = X.shape
         reg_scale = rl * (1 - self.alpha)
         z = _z(beta[0], beta[1:], X, fit_intercept)
+        if self.Tau is not None:
+            # depends only on Tau, so compute it once per cycle
+            InvCov = np.dot(self.Tau.T, self.Tau)
         for k in range(0, n_features + int(fit_intercept)):
             # Only update parameters in active set
             if ActiveSet[k] != 0:
@@ -780,7 +790,6 @@ class GLM(BaseEstimator):
                     else:
                         gk_reg, hk_reg = beta[k], 1.0
                 else:
-                    InvCov = np.dot(self.Tau.T, self.Tau)
                     if fit_intercept:
                         gk_reg = np.sum(InvCov[k - 1, :] * beta[1:])
                         hk_reg = InvCov[k - 1, k - 1]
@@ -1,7 +1,10 @@
 """Tests for metrics."""
 
 import numpy as np
+from numpy.testing import assert_allclose
+
 from pyglmnet import GLM, simulate_glm
+from pyglmnet.metrics import deviance
 
 
 def test_deviance():
@@ -21,6 +24,13 @@ def test_deviance():
 
     assert(isinstance(score, float))
 
+    # column vectors give the same deviance as 1D arrays
+    y_gauss = np.random.randn(n_samples)
+    yhat_gauss = np.random.randn(n_samples)
+    assert_allclose(deviance(y_gauss[:, None], yhat_gauss[:, None],
+                             'gaussian', 1.),
+                    deviance(y_gauss, yhat_gauss, 'gaussian', 1.))
+
 
 def test_pseudoR2():
     """Test pseudo r2."""
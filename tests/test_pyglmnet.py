@@ -241,11 +241,22 @@ def test_glmnet(distr, reg_lambda, fit_intercept, solver):
             for second_beta in betas_[i + 1:]:
                 assert_allclose(first_beta, second_beta, rtol=0.05, atol=1e-2)
 
-        # test fit_predict
-        glm_poisson = GLM(distr='softplus')
-        glm_poisson.fit_predict(X_train, y_train)
-        raises(ValueError, glm_poisson.fit_predict,
-               X_train[None, ...], y_train)
+
+def test_fit_predict():
+    """Test fit_predict."""
+    n_samples, n_features = 100, 10
+
+    np.random.seed(0)
+    beta0 = 1. / (np.float(n_features) + 1.) * np.random.normal(0.0, 1.0)
+    beta = 1. / (np.float(n_features) + 1.) * \
+        np.random.normal(0.0, 1.0, (n_features,))
+    X_train = np.random.normal(0.0, 1.0, [n_samples, n_features])
+    y_train = simulate_glm('softplus', beta0, beta, X_train, sample=False)
+
+    glm_poisson = GLM(distr='softplus')
+    glm_poisson.fit_predict(X_train, y_train)
+    raises(ValueError, glm_poisson.fit_predict,
+           X_train[None, ...], y_train)
 
 
 @pytest.mark.parametrize("distr", ALLOWED_DISTRS)
@@ -284,7 +295,7 @@ def test_glmcv(distr, solver):
         beta_ = glm.beta_
         assert_allclose(beta, beta_, atol=0.5)  # check fit
 
-        y_pred = glm.predict(scaler.transform(X_train))
+        y_pred = glm.predict(X_train)
         assert(y_pred.shape[0] == X_train.shape[0])
 
         # test picky score_metric check within fit().